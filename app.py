@@ -1,6 +1,8 @@
 # Streamlit Frontend for LLM-Powered Fact Checker
 # Provides a user-friendly interface for fact-checking claims
 
+import json
+
 import streamlit as st
 import httpx
 from datetime import datetime
@@ -13,8 +15,9 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Custom CSS for better styling - a module-level constant so the string is
+# built once; st.html injects it without the markdown sanitize pass
+_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -60,16 +63,30 @@ st.markdown("""
         margin-top: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# HTML template for one evidence item, formatted per retrieved document
+EVIDENCE_TMPL = '<div class="evidence-box"><strong>Evidence {i}:</strong><br>{ev}</div>'
 
 # Backend URL
 BACKEND_URL = "http://localhost:8000"
 
 
+@st.cache_resource(show_spinner=False)
+def get_client() -> httpx.Client:
+    """Pooled HTTP client shared across reruns (avoids a new TCP handshake per call)"""
+    return httpx.Client(
+        base_url=BACKEND_URL,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=httpx.Timeout(5.0, read=300.0)  # LLM can be slow on CPU
+    )
+
+
+@st.cache_data(ttl=5, show_spinner=False)
 def check_backend_health():
-    """Check if backend is healthy"""
+    """Check if backend is healthy (cached so reruns don't poll every interaction)"""
     try:
-        response = httpx.get(f"{BACKEND_URL}/health", timeout=5.0)
+        response = get_client().get("/health", timeout=5.0)
         if response.status_code == 200:
             return response.json()
         return None
@@ -77,51 +94,89 @@ def check_backend_health():
         return None
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def fact_check(claim: str):
-    """Send claim to backend for fact-checking"""
+    """Send claim to backend for fact-checking.
+
+    Cached on the normalized claim text so repeat queries in the same
+    session skip the slow LLM round-trip. Raises on failure so error
+    responses are never cached.
+    """
+    response = get_client().post(
+        "/check",
+        json={"claim": claim}
+    )
+    # Parse once and reuse - LLM responses are multi-KB bodies
     try:
-        response = httpx.post(
-            f"{BACKEND_URL}/check",
-            json={"claim": claim},
-            timeout=300.0  # 5 minutes - LLM can be slow on CPU
-        )
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"Error: {response.json().get('detail', 'Unknown error')}")
-            return None
-    except httpx.TimeoutException:
-        st.error("Request timed out. The backend might be processing a large request.")
-        return None
-    except Exception as e:
-        st.error(f"Error connecting to backend: {str(e)}")
-        return None
+        data = response.json()
+    except ValueError:
+        data = None
+    if response.status_code != 200:
+        detail = data.get('detail', 'Unknown error') if isinstance(data, dict) else 'Unknown error'
+        raise RuntimeError(detail)
+    return data
 
 
-def get_verdict_emoji(verdict: str) -> str:
-    """Get emoji for verdict"""
-    verdict_lower = verdict.lower()
-    if "true" in verdict_lower:
-        return "✅"
-    elif "false" in verdict_lower:
-        return "❌"
-    else:
-        return "🤷"
+def _sse_events(claim: str):
+    """Yield (event, data) pairs from the backend's /check/stream endpoint"""
+    with get_client().stream("POST", "/check/stream", json={"claim": claim}) as response:
+        response.raise_for_status()
+        event = None
+        for line in response.iter_lines():
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: ") and event:
+                yield event, json.loads(line[len("data: "):])
+
+
+def fact_check_stream(claim: str):
+    """Stream a fact-check from the backend, rendering progress as it arrives.
+
+    Shows stage updates and the verification model's output token-by-token,
+    so the user sees progress instead of a spinner for the full pipeline.
+    Returns the final result dict.
+    """
+    result_holder = {}
+
+    def tokens():
+        for event, data in _sse_events(claim):
+            if event == "token":
+                yield data["text"]
+            elif event == "result":
+                result_holder["result"] = data
+            elif event == "error":
+                raise RuntimeError(data.get("detail", "Unknown error"))
+
+    with st.status("Analyzing claim...", expanded=True) as status:
+        st.write_stream(tokens)
+        status.update(label="Analysis complete", state="complete", expanded=False)
 
+    return result_holder.get("result")
 
-def get_verdict_class(verdict: str) -> str:
-    """Get CSS class for verdict"""
+
+# (emoji, CSS class) per canonical verdict token; order matters since
+# "true" is checked before "false" to preserve the original precedence
+_VERDICT_TABLE = {
+    "true": ("✅", "verdict-true"),
+    "false": ("❌", "verdict-false"),
+}
+_VERDICT_DEFAULT = ("🤷", "verdict-unverifiable")
+
+
+def classify_verdict(verdict: str) -> tuple[str, str]:
+    """Get (emoji, CSS class) for verdict in a single pass"""
     verdict_lower = verdict.lower()
-    if "true" in verdict_lower:
-        return "verdict-true"
-    elif "false" in verdict_lower:
-        return "verdict-false"
-    else:
-        return "verdict-unverifiable"
+    for token, style in _VERDICT_TABLE.items():
+        if token in verdict_lower:
+            return style
+    return _VERDICT_DEFAULT
 
 
 # Main App
 def main():
+    # Inject styling once per run
+    st.html(_CSS)
+
     # Header
     st.markdown('<p class="main-header">🔍 LLM-Powered Fact Checker</p>', unsafe_allow_html=True)
     st.markdown("---")
@@ -154,16 +209,29 @@ def main():
     
     # Process claim
     if check_button and claim.strip():
-        with st.spinner("Analyzing claim... This may take a moment."):
-            result = fact_check(claim)
-        
+        try:
+            result = fact_check_stream(claim.strip())
+        except httpx.TimeoutException:
+            st.error("Request timed out. The backend might be processing a large request.")
+            result = None
+        except Exception:
+            # Streaming unavailable - fall back to the buffered endpoint
+            try:
+                with st.spinner("Analyzing claim... This may take a moment."):
+                    result = fact_check(claim.strip())
+            except httpx.TimeoutException:
+                st.error("Request timed out. The backend might be processing a large request.")
+                result = None
+            except Exception as e:
+                st.error(f"Error connecting to backend: {str(e)}")
+                result = None
+
         if result:
             st.markdown("---")
             
             # Verdict
             verdict = result.get("verdict", "Unverifiable")
-            emoji = get_verdict_emoji(verdict)
-            verdict_class = get_verdict_class(verdict)
+            emoji, verdict_class = classify_verdict(verdict)
             
             st.markdown(
                 f'<div class="{verdict_class}">{emoji} {verdict}</div>',
@@ -180,11 +248,11 @@ def main():
             st.subheader("📚 Evidence")
             evidence = result.get("evidence", [])
             if evidence:
-                for i, ev in enumerate(evidence, 1):
-                    st.markdown(
-                        f'<div class="evidence-box"><strong>Evidence {i}:</strong><br>{ev}</div>',
-                        unsafe_allow_html=True
-                    )
+                # One concatenated render instead of one delta message per item
+                st.markdown(
+                    "".join(EVIDENCE_TMPL.format(i=i, ev=ev) for i, ev in enumerate(evidence, 1)),
+                    unsafe_allow_html=True
+                )
             else:
                 st.warning("No relevant evidence found in the database.")
             
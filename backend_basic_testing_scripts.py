@@ -18,6 +18,7 @@ Usage:
 import sys
 import json
 import time
+import asyncio
 import argparse
 from datetime import datetime
 from typing import Tuple, List, Dict, Any
@@ -28,6 +29,14 @@ import httpx
 BASE_URL = "http://localhost:8000"
 TIMEOUT = 120.0  # seconds
 
+# Shared HTTP client - one pooled session per test run so every request
+# reuses the same TCP connection instead of paying a fresh handshake
+CLIENT = httpx.Client(
+    base_url=BASE_URL,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=TIMEOUT
+)
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -47,13 +56,14 @@ def print_header(text: str):
     print(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.RESET}\n")
 
 
-def print_test(name: str, passed: bool, message: str = "", duration: float = 0):
-    """Print test result"""
+def format_test(name: str, passed: bool, message: str = "", duration: float = 0) -> str:
+    """Format a test result line (buffered so printing stays off the timed path)"""
     status = f"{Colors.GREEN}✓ PASS{Colors.RESET}" if passed else f"{Colors.RED}✗ FAIL{Colors.RESET}"
     duration_str = f" ({duration:.2f}s)" if duration > 0 else ""
-    print(f"  {status} {name}{duration_str}")
+    line = f"  {status} {name}{duration_str}"
     if message and not passed:
-        print(f"       {Colors.YELLOW}→ {message}{Colors.RESET}")
+        line += f"\n       {Colors.YELLOW}→ {message}{Colors.RESET}"
+    return line
 
 
 class TestResults:
@@ -108,12 +118,12 @@ class TestResults:
 # TEST FUNCTIONS
 # =============================================================================
 
-def test_server_running() -> Tuple[bool, str, float]:
+def test_server_running(client: httpx.Client) -> Tuple[bool, str, float]:
     """Test if the server is running and responding"""
-    start = time.time()
+    start = time.perf_counter()
     try:
-        response = httpx.get(f"{BASE_URL}/health", timeout=5.0)
-        duration = time.time() - start
+        response = client.get("/health", timeout=5.0)
+        duration = time.perf_counter() - start
         if response.status_code == 200:
             return True, "", duration
         else:
@@ -124,12 +134,12 @@ def test_server_running() -> Tuple[bool, str, float]:
         return False, str(e), 0
 
 
-def test_health_endpoint() -> Tuple[bool, str, float]:
+def test_health_endpoint(client: httpx.Client) -> Tuple[bool, str, float]:
     """Test health endpoint returns correct structure"""
-    start = time.time()
+    start = time.perf_counter()
     try:
-        response = httpx.get(f"{BASE_URL}/health", timeout=10.0)
-        duration = time.time() - start
+        response = client.get("/health", timeout=10.0)
+        duration = time.perf_counter() - start
         data = response.json()
         
         required_fields = ["status", "timestamp", "vectordb_status", "document_count"]
@@ -149,12 +159,12 @@ def test_health_endpoint() -> Tuple[bool, str, float]:
         return False, str(e), 0
 
 
-def test_vectordb_populated() -> Tuple[bool, str, float]:
+def test_vectordb_populated(client: httpx.Client) -> Tuple[bool, str, float]:
     """Test that the vector database has documents"""
-    start = time.time()
+    start = time.perf_counter()
     try:
-        response = httpx.get(f"{BASE_URL}/health", timeout=10.0)
-        duration = time.time() - start
+        response = client.get("/health", timeout=10.0)
+        duration = time.perf_counter() - start
         data = response.json()
         
         doc_count = data.get("document_count", 0)
@@ -168,13 +178,13 @@ def test_vectordb_populated() -> Tuple[bool, str, float]:
         return False, str(e), 0
 
 
-def test_check_endpoint_exists() -> Tuple[bool, str, float]:
+def test_check_endpoint_exists(client: httpx.Client) -> Tuple[bool, str, float]:
     """Test that /check endpoint exists and requires POST"""
-    start = time.time()
+    start = time.perf_counter()
     try:
         # GET should fail
-        response = httpx.get(f"{BASE_URL}/check", timeout=5.0)
-        duration = time.time() - start
+        response = client.get("/check", timeout=5.0)
+        duration = time.perf_counter() - start
         
         if response.status_code == 405:  # Method Not Allowed
             return True, "", duration
@@ -186,16 +196,16 @@ def test_check_endpoint_exists() -> Tuple[bool, str, float]:
         return False, str(e), 0
 
 
-def test_check_empty_claim() -> Tuple[bool, str, float]:
+def test_check_empty_claim(client: httpx.Client) -> Tuple[bool, str, float]:
     """Test that empty claim returns 400 error"""
-    start = time.time()
+    start = time.perf_counter()
     try:
-        response = httpx.post(
-            f"{BASE_URL}/check",
+        response = client.post(
+            "/check",
             json={"claim": ""},
             timeout=10.0
         )
-        duration = time.time() - start
+        duration = time.perf_counter() - start
         
         if response.status_code == 400:
             return True, "", duration
@@ -205,17 +215,17 @@ def test_check_empty_claim() -> Tuple[bool, str, float]:
         return False, str(e), 0
 
 
-def test_check_invalid_json() -> Tuple[bool, str, float]:
+def test_check_invalid_json(client: httpx.Client) -> Tuple[bool, str, float]:
     """Test that invalid JSON returns 422 error"""
-    start = time.time()
+    start = time.perf_counter()
     try:
-        response = httpx.post(
-            f"{BASE_URL}/check",
+        response = client.post(
+            "/check",
             content="invalid json",
             headers={"Content-Type": "application/json"},
             timeout=10.0
         )
-        duration = time.time() - start
+        duration = time.perf_counter() - start
         
         if response.status_code == 422:
             return True, "", duration
@@ -225,16 +235,15 @@ def test_check_invalid_json() -> Tuple[bool, str, float]:
         return False, str(e), 0
 
 
-def test_check_true_claim() -> Tuple[bool, str, float]:
+async def test_check_true_claim(client: httpx.AsyncClient) -> Tuple[bool, str, float]:
     """Test fact-checking with a claim that should be TRUE"""
-    start = time.time()
+    start = time.perf_counter()
     try:
-        response = httpx.post(
-            f"{BASE_URL}/check",
-            json={"claim": "India became the 5th largest economy in 2022"},
-            timeout=TIMEOUT
+        response = await client.post(
+            "/check",
+            json={"claim": "India became the 5th largest economy in 2022"}
         )
-        duration = time.time() - start
+        duration = time.perf_counter() - start
         
         if response.status_code != 200:
             return False, f"Status code: {response.status_code}", duration
@@ -262,16 +271,15 @@ def test_check_true_claim() -> Tuple[bool, str, float]:
         return False, str(e), 0
 
 
-def test_check_false_claim() -> Tuple[bool, str, float]:
+async def test_check_false_claim(client: httpx.AsyncClient) -> Tuple[bool, str, float]:
     """Test fact-checking with a claim that should be FALSE/Unverifiable"""
-    start = time.time()
+    start = time.perf_counter()
     try:
-        response = httpx.post(
-            f"{BASE_URL}/check",
-            json={"claim": "The Indian government has announced free electricity to all farmers starting July 2025"},
-            timeout=TIMEOUT
+        response = await client.post(
+            "/check",
+            json={"claim": "The Indian government has announced free electricity to all farmers starting July 2025"}
         )
-        duration = time.time() - start
+        duration = time.perf_counter() - start
         
         if response.status_code != 200:
             return False, f"Status code: {response.status_code}", duration
@@ -296,16 +304,15 @@ def test_check_false_claim() -> Tuple[bool, str, float]:
         return False, str(e), 0
 
 
-def test_response_has_evidence() -> Tuple[bool, str, float]:
+async def test_response_has_evidence(client: httpx.AsyncClient) -> Tuple[bool, str, float]:
     """Test that responses include relevant evidence"""
-    start = time.time()
+    start = time.perf_counter()
     try:
-        response = httpx.post(
-            f"{BASE_URL}/check",
-            json={"claim": "Chandrayaan-3 landed on the Moon in 2023"},
-            timeout=TIMEOUT
+        response = await client.post(
+            "/check",
+            json={"claim": "Chandrayaan-3 landed on the Moon in 2023"}
         )
-        duration = time.time() - start
+        duration = time.perf_counter() - start
         
         if response.status_code != 200:
             return False, f"Status code: {response.status_code}", duration
@@ -325,16 +332,15 @@ def test_response_has_evidence() -> Tuple[bool, str, float]:
         return False, str(e), 0
 
 
-def test_response_has_reasoning() -> Tuple[bool, str, float]:
+async def test_response_has_reasoning(client: httpx.AsyncClient) -> Tuple[bool, str, float]:
     """Test that responses include reasoning"""
-    start = time.time()
+    start = time.perf_counter()
     try:
-        response = httpx.post(
-            f"{BASE_URL}/check",
-            json={"claim": "PM-KISAN has helped over 10 crore farmers"},
-            timeout=TIMEOUT
+        response = await client.post(
+            "/check",
+            json={"claim": "PM-KISAN has helped over 10 crore farmers"}
         )
-        duration = time.time() - start
+        duration = time.perf_counter() - start
         
         if response.status_code != 200:
             return False, f"Status code: {response.status_code}", duration
@@ -353,16 +359,15 @@ def test_response_has_reasoning() -> Tuple[bool, str, float]:
         return False, str(e), 0
 
 
-def test_confidence_score() -> Tuple[bool, str, float]:
+async def test_confidence_score(client: httpx.AsyncClient) -> Tuple[bool, str, float]:
     """Test that responses include confidence score"""
-    start = time.time()
+    start = time.perf_counter()
     try:
-        response = httpx.post(
-            f"{BASE_URL}/check",
-            json={"claim": "India has over 140 crore Aadhaar cards issued"},
-            timeout=TIMEOUT
+        response = await client.post(
+            "/check",
+            json={"claim": "India has over 140 crore Aadhaar cards issued"}
         )
-        duration = time.time() - start
+        duration = time.perf_counter() - start
         
         if response.status_code != 200:
             return False, f"Status code: {response.status_code}", duration
@@ -401,23 +406,27 @@ def run_quick_tests(results: TestResults, verbose: bool = False):
         ("Invalid JSON Rejected", test_check_invalid_json),
     ]
     
+    lines = []
+    server_ok = True
     for name, test_func in tests:
-        passed, message, duration = test_func()
+        passed, message, duration = test_func(CLIENT)
         results.add(name, passed, message, duration)
-        print_test(name, passed, message, duration)
+        lines.append(format_test(name, passed, message, duration))
         
         # Stop if server not running
         if name == "Server Running" and not passed:
-            print(f"\n  {Colors.RED}Cannot continue - server not running{Colors.RESET}")
-            return False
+            server_ok = False
+            break
     
-    return True
+    print("\n".join(lines))
+    if not server_ok:
+        print(f"\n  {Colors.RED}Cannot continue - server not running{Colors.RESET}")
+    
+    return server_ok
 
 
-def run_llm_tests(results: TestResults, verbose: bool = False):
-    """Run tests that require LLM calls (slower)"""
-    print_header("LLM TESTS (Requires Ollama)")
-    
+async def _run_llm_tests_async(results: TestResults, verbose: bool = False):
+    """Fire all LLM tests concurrently over a shared async client"""
     tests = [
         ("True Claim (India 5th Economy)", test_check_true_claim),
         ("False Claim (Free Electricity)", test_check_false_claim),
@@ -426,17 +435,33 @@ def run_llm_tests(results: TestResults, verbose: bool = False):
         ("Confidence Score", test_confidence_score),
     ]
     
-    for name, test_func in tests:
-        if verbose:
-            print(f"  {Colors.CYAN}Running: {name}...{Colors.RESET}", end="", flush=True)
-        
-        passed, message, duration = test_func()
+    if verbose:
+        print(f"  {Colors.CYAN}Running {len(tests)} LLM tests concurrently...{Colors.RESET}")
+    
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    ) as client:
+        outcomes = await asyncio.gather(*[test_func(client) for _, test_func in tests])
+    
+    lines = []
+    for (name, _), (passed, message, duration) in zip(tests, outcomes):
         results.add(name, passed, message, duration)
-        
-        if verbose:
-            print(f"\r", end="")  # Clear the "Running" line
-        
-        print_test(name, passed, message, duration)
+        lines.append(format_test(name, passed, message, duration))
+    
+    print("\n".join(lines))
+
+
+def run_llm_tests(results: TestResults, verbose: bool = False):
+    """Run tests that require LLM calls (slower)
+    
+    The backend is stateless per-/check, so the tests run concurrently and
+    wall-clock drops from the sum of latencies to roughly the slowest one.
+    """
+    print_header("LLM TESTS (Requires Ollama)")
+    
+    asyncio.run(_run_llm_tests_async(results, verbose))
     
     return True
 
@@ -2,17 +2,22 @@
 # Provides REST API endpoints for fact-checking
 
 import sys
+import json
+import asyncio
 from datetime import datetime
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import uvicorn
 
 from src.fact_checker import logging
 from src.fact_checker.pipeline import DataIngestionPipeline, FactCheckingPipeline
 from src.fact_checker.entity import FactCheckEntity
+from src.fact_checker.components import VERIFICATION_ERROR_PREFIX
 
 
 # Request/Response Models
@@ -39,14 +44,92 @@ class HealthResponse(BaseModel):
     document_count: int
 
 
+# Maximum concurrent pipeline runs - a CPU-hosted Ollama can only really
+# serve 1-2 generations at a time, so overflow requests queue on a semaphore
+# instead of thrashing the model
+MAX_CONCURRENT_CHECKS = 2
+
+# Micro-batching policy for /check: claims arriving within MAX_BATCH_WAIT
+# seconds of each other share one pipeline pass (batched detection and
+# retrieval), up to MAX_BATCH_SIZE claims per pass
+MAX_BATCH_SIZE = 8
+MAX_BATCH_WAIT = 0.05
+
+# Semantic response cache: claims whose embeddings are this similar to an
+# already-answered claim reuse its response, skipping the whole LLM pass
+SEMCACHE_MAX_ENTRIES = 512
+SEMCACHE_THRESHOLD = 0.95
+
 # Global state
 app_state = {
     "fact_checker": None,
     "document_count": 0,
-    "is_ready": False
+    "is_ready": False,
+    "llm_semaphore": None,
+    "check_queue": None,
+    "batcher_task": None,
+    "semcache": None
 }
 
 
+def semcache_lookup(embedding):
+    """Return the cached response for a semantically equivalent claim, if any"""
+    semcache = app_state["semcache"]
+    for key, (cached_embedding, response) in semcache.items():
+        if float(embedding @ cached_embedding) >= SEMCACHE_THRESHOLD:
+            semcache.move_to_end(key)
+            return response
+    return None
+
+
+def semcache_store(key, embedding, response):
+    """Store a response keyed on the normalized claim, with LRU eviction"""
+    semcache = app_state["semcache"]
+    semcache[key] = (embedding, response)
+    semcache.move_to_end(key)
+    while len(semcache) > SEMCACHE_MAX_ENTRIES:
+        semcache.popitem(last=False)
+
+
+async def check_batcher():
+    """
+    Background task that micro-batches /check requests.
+
+    Pops up to MAX_BATCH_SIZE queued claims (waiting at most MAX_BATCH_WAIT
+    seconds after the first arrival), runs them through the pipeline as one
+    batch, and resolves each request's future with its result.
+    """
+    queue = app_state["check_queue"]
+    loop = asyncio.get_running_loop()
+
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + MAX_BATCH_WAIT
+        while len(batch) < MAX_BATCH_SIZE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        claims = [claim for claim, _ in batch]
+        try:
+            async with app_state["llm_semaphore"]:
+                results = await asyncio.to_thread(
+                    app_state["fact_checker"].run_batch, claims
+                )
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            logging.exception(f"Batch fact-check failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application startup and shutdown events"""
@@ -66,11 +149,23 @@ async def lifespan(app: FastAPI):
         # Step 2: Initialize Fact Checking Pipeline (lazy loading of models)
         logging.info("Step 2: Initializing Fact Checking Pipeline...")
         app_state["fact_checker"] = FactCheckingPipeline()
+        app_state["llm_semaphore"] = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+        # Built fresh after ingestion, so cached responses always reflect the
+        # current vector-DB contents
+        app_state["semcache"] = OrderedDict()
+        app_state["check_queue"] = asyncio.Queue()
+        app_state["batcher_task"] = asyncio.create_task(check_batcher())
+
+        # Preload LLM weights so the first /check doesn't pay Ollama's
+        # cold-load cost; keep_alive=-1 pins them resident
+        logging.info("Preloading Ollama models...")
+        app_state["fact_checker"].preload_models()
         
-        # Step 3: Health Check - Test retrieval and LLM
+        # Step 3: Health Check - cheap probe of retrieval and LLM instead of
+        # a full pipeline run, which could add minutes on a CPU-hosted Ollama
         logging.info("Step 3: Running health check...")
-        test_result = app_state["fact_checker"].run("Test query for health check")
-        logging.info(f"Health check passed: verdict={test_result.verdict}")
+        app_state["fact_checker"].smoke_test()
+        logging.info("Health check passed")
         
         app_state["is_ready"] = True
         logging.info("=" * 60)
@@ -85,6 +180,8 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logging.info("Application shutting down...")
+    if app_state["batcher_task"] is not None:
+        app_state["batcher_task"].cancel()
 
 
 # Create FastAPI app
@@ -106,7 +203,7 @@ app.add_middleware(
 
 
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
-def health_check():
+async def health_check():
     """
     Health check endpoint.
     Returns the status of the application and vector database.
@@ -120,7 +217,7 @@ def health_check():
 
 
 @app.post("/check", response_model=FactCheckResponse, tags=["Fact Check"])
-def check_fact(request: FactCheckRequest):
+async def check_fact(request: FactCheckRequest):
     """
     Fact-check a claim.
     
@@ -142,9 +239,29 @@ def check_fact(request: FactCheckRequest):
     try:
         logging.info(f"Received fact-check request: {request.claim[:100]}...")
         
-        result: FactCheckEntity = app_state["fact_checker"].run(request.claim)
+        # Semantic cache: an equivalent claim answered recently short-circuits
+        # the entire pipeline
+        normalized_claim = request.claim.strip().lower()
+        embedding = await asyncio.to_thread(
+            app_state["fact_checker"].encode_claim, normalized_claim
+        )
+        cached = semcache_lookup(embedding)
+        if cached is not None:
+            logging.info("Semantic cache hit - returning cached response")
+            # Rebuild the echo fields: the cached response carries a
+            # different user's claim text, which must not leak back here
+            return cached.model_copy(update={
+                "original_input": request.claim,
+                "claim": request.claim
+            })
+        
+        # Hand the claim to the micro-batcher so concurrent requests share
+        # one pipeline pass; the future resolves with this claim's result
+        future = asyncio.get_running_loop().create_future()
+        await app_state["check_queue"].put((request.claim, future))
+        result: FactCheckEntity = await future
         
-        return FactCheckResponse(
+        response = FactCheckResponse(
             original_input=result.original_input,
             claim=result.claim,
             verdict=result.verdict,
@@ -152,6 +269,11 @@ def check_fact(request: FactCheckRequest):
             reasoning=result.reasoning,
             confidence_score=result.confidence_score
         )
+        # Never cache verification error fallbacks - a transient Ollama
+        # outage must not be replayed to similar claims after it recovers
+        if not result.reasoning.startswith(VERIFICATION_ERROR_PREFIX):
+            semcache_store(normalized_claim, embedding, response)
+        return response
         
     except Exception as e:
         logging.exception(f"Error processing fact-check request: {e}")
@@ -161,6 +283,75 @@ def check_fact(request: FactCheckRequest):
         )
 
 
+@app.post("/check/stream", tags=["Fact Check"])
+async def check_fact_stream(request: FactCheckRequest):
+    """
+    Fact-check a claim, streaming progress as Server-Sent Events.
+
+    Emits detection, claim, evidence, token, and result events so clients
+    can render intermediate stages instead of waiting for the full
+    pipeline to finish.
+    """
+    if not app_state["is_ready"]:
+        raise HTTPException(
+            status_code=503,
+            detail="Service not ready. Please wait for startup to complete."
+        )
+
+    if not request.claim or len(request.claim.strip()) == 0:
+        raise HTTPException(
+            status_code=400,
+            detail="Claim cannot be empty"
+        )
+
+    logging.info(f"Received streaming fact-check request: {request.claim[:100]}...")
+
+    # Same semantic-cache probe as /check, so equivalent claims skip the
+    # pipeline on the streaming path too
+    normalized_claim = request.claim.strip().lower()
+    embedding = await asyncio.to_thread(
+        app_state["fact_checker"].encode_claim, normalized_claim
+    )
+    cached = semcache_lookup(embedding)
+
+    async def event_gen():
+        try:
+            if cached is not None:
+                logging.info("Semantic cache hit - streaming cached response")
+                # Rebuild the echo fields so another user's claim text
+                # isn't replayed to this caller
+                response = cached.model_copy(update={
+                    "original_input": request.claim,
+                    "claim": request.claim
+                })
+                yield f"event: result\ndata: {json.dumps(response.model_dump())}\n\n"
+                return
+
+            # The semaphore gates streaming runs too - this is the UI's
+            # primary path, and without it N streaming users mean N
+            # concurrent pipeline runs thrashing Ollama
+            async with app_state["llm_semaphore"]:
+                stream = app_state["fact_checker"].run_stream(request.claim)
+                while True:
+                    event = await asyncio.to_thread(next, stream, None)
+                    if event is None:
+                        break
+                    if (
+                        event["event"] == "result"
+                        and not event["data"]["reasoning"].startswith(VERIFICATION_ERROR_PREFIX)
+                    ):
+                        semcache_store(
+                            normalized_claim, embedding,
+                            FactCheckResponse(**event["data"])
+                        )
+                    yield f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+        except Exception as e:
+            logging.exception(f"Error processing streaming fact-check request: {e}")
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+
+    return StreamingResponse(event_gen(), media_type="text/event-stream")
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "main:app",
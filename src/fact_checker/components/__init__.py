@@ -1,9 +1,10 @@
 # Components module - exports all component classes
 
 from .data_ingestion import DataIngestionComponents
-from .fact_checking import FactCheckingComponents
+from .fact_checking import FactCheckingComponents, VERIFICATION_ERROR_PREFIX
 
 __all__ = [
     "DataIngestionComponents",
-    "FactCheckingComponents"
+    "FactCheckingComponents",
+    "VERIFICATION_ERROR_PREFIX"
 ]
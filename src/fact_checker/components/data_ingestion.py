@@ -2,10 +2,14 @@
 # Loads verified facts from CSV, embeds them, and stores in ChromaDB
 
 import csv
+import hashlib
 import sys
 from pathlib import Path
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Tuple
 
+import numpy as np
+import torch
 import chromadb
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
@@ -15,132 +19,269 @@ from src.fact_checker.exception import CustomException
 from src.fact_checker.entity import DataIngestionEntity
 from src.fact_checker.config import DataIngestionConfigInstance
 
+# pyarrow's multithreaded C++ CSV parser is used when available; the stdlib
+# csv module remains the fallback for small files or missing pyarrow
+try:
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa_csv = None
+
+# Below this size the stdlib parser finishes in microseconds anyway, so the
+# Arrow reader setup isn't worth it
+PYARROW_MIN_FILE_SIZE = 1 << 20  # 1 MiB
+
+# One CSV row: (id, statement, source, date, category)
+FactRow = Tuple[str, str, str, str, str]
+
 
 class DataIngestionComponents:
     """
     Component for ingesting verified facts into ChromaDB.
-    
+
     Usage:
         component = DataIngestionComponents()
         result = component.run()
     """
-    
+
     def __init__(self, config=None):
         """Initialize with configuration"""
         self.config = config or DataIngestionConfigInstance
         self.embedding_model = None
         self.chroma_client = None
         self.collection = None
-        
-    def _load_csv_data(self) -> List[Dict]:
-        """Load verified facts from CSV file"""
+
+    def _iter_csv_rows_arrow(self) -> Iterator[FactRow]:
+        """Stream CSV rows through pyarrow's multithreaded incremental reader"""
+        with pa_csv.open_csv(
+            str(self.config.csv_file_path),
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=8 << 20)
+        ) as reader:
+            for batch in reader:
+                # id/date may be inferred as non-string types; normalize to
+                # str to match the stdlib path
+                columns = zip(
+                    batch.column('id').to_pylist(),
+                    batch.column('statement').to_pylist(),
+                    batch.column('source').to_pylist(),
+                    batch.column('date').to_pylist(),
+                    batch.column('category').to_pylist()
+                )
+                for fact_id, statement, source, date, category in columns:
+                    yield str(fact_id), statement, source, str(date), category
+
+    def _iter_csv_rows(self) -> Iterator[FactRow]:
+        """Yield verified-fact rows from the CSV without materializing the file.
+
+        Streaming keeps peak memory bounded by the embed batch size rather
+        than the corpus size, and lets parsing overlap with embedding.
+        """
         try:
-            logging.info(f"Loading data from {self.config.csv_file_path}")
-            facts = []
-            
-            with open(self.config.csv_file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            logging.info(f"Streaming data from {self.config.csv_file_path}")
+
+            if pa_csv is not None and Path(self.config.csv_file_path).stat().st_size >= PYARROW_MIN_FILE_SIZE:
+                yield from self._iter_csv_rows_arrow()
+                return
+
+            # csv.reader with index-based access skips the per-row dict that
+            # DictReader allocates just to be re-projected into columns
+            with open(self.config.csv_file_path, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader)
+                column = {name: i for i, name in enumerate(header)}
+                id_col = column['id']
+                statement_col = column['statement']
+                source_col = column['source']
+                date_col = column['date']
+                category_col = column['category']
+
                 for row in reader:
-                    facts.append({
-                        'id': row['id'],
-                        'statement': row['statement'],
-                        'source': row['source'],
-                        'date': row['date'],
-                        'category': row['category']
-                    })
-            
-            logging.info(f"Loaded {len(facts)} facts from CSV")
-            return facts
-            
+                    yield row[id_col], row[statement_col], row[source_col], row[date_col], row[category_col]
+
         except Exception as e:
             logging.exception(e)
             raise CustomException(e, sys)
-    
+
     def _load_embedding_model(self) -> SentenceTransformer:
         """Load the embedding model from HuggingFace"""
         try:
-            logging.info(f"Loading embedding model: {self.config.embedding_model_name}")
-            model = SentenceTransformer(self.config.embedding_model_name)
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            logging.info(f"Loading embedding model: {self.config.embedding_model_name} on {device}")
+            model = SentenceTransformer(self.config.embedding_model_name, device=device)
+            if device == "cuda":
+                # FP16 halves activation bandwidth; embedding quality loss is negligible
+                model.half()
             logging.info("Embedding model loaded successfully")
             return model
-            
+
         except Exception as e:
             logging.exception(e)
             raise CustomException(e, sys)
-    
+
     def _initialize_chromadb(self) -> chromadb.Collection:
         """Initialize ChromaDB and create/get collection"""
         try:
             logging.info(f"Initializing ChromaDB at {self.config.chroma_db_path}")
-            
+
             # Ensure directory exists
             self.config.chroma_db_path.mkdir(parents=True, exist_ok=True)
-            
+
             # Create persistent client
             self.chroma_client = chromadb.PersistentClient(
                 path=str(self.config.chroma_db_path),
                 settings=Settings(anonymized_telemetry=False)
             )
-            
-            # Get or create collection
+
+            # Cosine space: embeddings are unit-normalized at encode time,
+            # so distance is a plain dot product instead of a full L2 norm
+            collection_metadata = {
+                "description": "Verified facts from PIB for fact-checking",
+                "hnsw:space": "cosine"
+            }
             collection = self.chroma_client.get_or_create_collection(
                 name=self.config.collection_name,
-                metadata={"description": "Verified facts from PIB for fact-checking"}
+                metadata=collection_metadata
             )
-            
+
+            # get_or_create_collection ignores metadata for an existing
+            # collection, so a database built under the old default L2 space
+            # would silently keep it - and retrieval's 1 - d scoring assumes
+            # cosine. Rebuild the collection when the space doesn't match;
+            # the lost content hashes just mean one full re-ingest
+            if (collection.metadata or {}).get("hnsw:space") != "cosine":
+                logging.warning(
+                    f"Collection '{self.config.collection_name}' uses "
+                    f"{(collection.metadata or {}).get('hnsw:space', 'l2')} space; recreating with cosine"
+                )
+                self.chroma_client.delete_collection(name=self.config.collection_name)
+                collection = self.chroma_client.create_collection(
+                    name=self.config.collection_name,
+                    metadata=collection_metadata
+                )
+
             logging.info(f"ChromaDB collection '{self.config.collection_name}' ready")
             return collection
-            
+
         except Exception as e:
             logging.exception(e)
             raise CustomException(e, sys)
-    
-    def _embed_and_store(self, facts: List[Dict]) -> int:
-        """Embed facts and store in ChromaDB"""
-        try:
-            logging.info("Embedding and storing facts in ChromaDB")
-            
-            # Check if collection already has data
-            existing_count = self.collection.count()
-            if existing_count > 0:
-                logging.info(f"Collection already has {existing_count} documents. Skipping ingestion.")
-                return existing_count
-            
-            # Prepare data for embedding
-            documents = [fact['statement'] for fact in facts]
-            ids = [f"fact_{fact['id']}" for fact in facts]
-            metadatas = [
-                {
-                    'source': fact['source'],
-                    'date': fact['date'],
-                    'category': fact['category']
-                }
-                for fact in facts
-            ]
-            
-            # Generate embeddings
-            logging.info("Generating embeddings...")
-            embeddings = self.embedding_model.encode(documents, show_progress_bar=True)
-            
-            # Add to collection
-            self.collection.add(
+
+    def _existing_content_hashes(self) -> dict:
+        """Fetch {id: content_hash} for everything already in the collection"""
+        existing = self.collection.get(include=["metadatas"])
+        return {
+            doc_id: (metadata or {}).get("content_hash", "")
+            for doc_id, metadata in zip(existing["ids"], existing["metadatas"])
+        }
+
+    @staticmethod
+    def _content_hash(fact_id: str, statement: str) -> str:
+        """Stable digest of a row's identity and text for change detection"""
+        return hashlib.blake2b(f"{fact_id}:{statement}".encode("utf-8"), digest_size=16).hexdigest()
+
+    def _flush_batch(self, executor: ThreadPoolExecutor, futures: list, batch: list) -> None:
+        """Embed one buffered batch and submit its upsert to the executor"""
+        documents = [statement for _, statement, _, _, _, _ in batch]
+        # encode() length-sorts the inputs internally before batching and
+        # restores the original order afterwards, so each model batch is
+        # padded to near-uniform sequence length already
+        embeddings = self.embedding_model.encode(
+            documents,
+            batch_size=self.config.encode_batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        # Stage the buffer in FP16 - halves the bytes held while this batch
+        # waits in the upsert queue; the normalized unit vectors lose nothing
+        # meaningful at half precision. Chroma stores FP32, so the buffer is
+        # widened back right at the upsert boundary below
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float16)
+        metadatas = [
+            {
+                'source': source,
+                'date': date,
+                'category': category,
+                'content_hash': content_hash
+            }
+            for _, _, source, date, category, content_hash in batch
+        ]
+        ids = [doc_id for doc_id, _, _, _, _, _ in batch]
+
+        def upsert():
+            # Widen inside the worker so only batches actively being written
+            # hold an FP32 copy; queued batches stay at half size.
+            # upsert rather than add: a changed row keeps its id and
+            # overwrites the stale document in place
+            self.collection.upsert(
                 documents=documents,
-                embeddings=embeddings.tolist(),
+                embeddings=np.ascontiguousarray(embeddings, dtype=np.float32),
                 ids=ids,
                 metadatas=metadatas
             )
-            
-            logging.info(f"Successfully stored {len(documents)} facts in ChromaDB")
-            return len(documents)
-            
+
+        futures.append(executor.submit(upsert))
+
+    def _embed_and_store(self, rows: Iterator[FactRow]) -> int:
+        """Stream rows through embed + upsert, touching only changed rows.
+
+        Rows flow parse -> hash-diff -> encode -> upsert in fixed-size
+        batches, so peak memory is one batch regardless of corpus size and
+        the Chroma writes overlap the next batch's parsing and encoding.
+        """
+        try:
+            logging.info("Embedding and storing facts in ChromaDB")
+
+            # Diff each row against the collection by content hash so repeat
+            # runs only embed new or edited rows
+            existing_hashes = self._existing_content_hashes()
+
+            total = 0
+            changed = 0
+            seen_ids = set()
+            batch = []  # (doc_id, statement, source, date, category, hash)
+            batch_size = self.config.add_batch_size
+
+            with ThreadPoolExecutor(max_workers=self.config.add_max_workers) as executor:
+                futures = []
+                for fact_id, statement, source, date, category in rows:
+                    total += 1
+                    doc_id = f"fact_{fact_id}"
+                    seen_ids.add(doc_id)
+
+                    digest = self._content_hash(fact_id, statement)
+                    if existing_hashes.get(doc_id) == digest:
+                        continue
+
+                    changed += 1
+                    batch.append((doc_id, statement, source, date, category, digest))
+                    if len(batch) >= batch_size:
+                        self._flush_batch(executor, futures, batch)
+                        batch = []
+
+                if batch:
+                    self._flush_batch(executor, futures, batch)
+                for future in futures:
+                    future.result()
+
+            removed_ids = list(set(existing_hashes) - seen_ids)
+            if removed_ids:
+                logging.info(f"Removing {len(removed_ids)} facts no longer in the CSV")
+                self.collection.delete(ids=removed_ids)
+
+            if changed:
+                logging.info(f"Stored {changed} new or changed facts of {total} in ChromaDB")
+            else:
+                logging.info(f"All {total} facts unchanged. Skipped embedding.")
+            return total
+
         except Exception as e:
             logging.exception(e)
             raise CustomException(e, sys)
-    
+
     def run(self) -> DataIngestionEntity:
         """
         Execute the data ingestion pipeline.
-        
+
         Returns:
             DataIngestionEntity: Result of the ingestion process
         """
@@ -148,22 +289,19 @@ class DataIngestionComponents:
             logging.info("=" * 50)
             logging.info("Starting Data Ingestion Pipeline")
             logging.info("=" * 50)
-            
-            # Step 1: Load CSV data
-            facts = self._load_csv_data()
-            
-            # Step 2: Load embedding model
+
+            # Step 1: Load embedding model
             self.embedding_model = self._load_embedding_model()
-            
-            # Step 3: Initialize ChromaDB
+
+            # Step 2: Initialize ChromaDB
             self.collection = self._initialize_chromadb()
-            
-            # Step 4: Embed and store
-            doc_count = self._embed_and_store(facts)
-            
+
+            # Step 3: Stream CSV rows through embed and store
+            doc_count = self._embed_and_store(self._iter_csv_rows())
+
             logging.info("Data Ingestion Pipeline completed successfully")
             logging.info("=" * 50)
-            
+
             return DataIngestionEntity(
                 chroma_db_path=self.config.chroma_db_path,
                 collection_name=self.config.collection_name,
@@ -171,7 +309,7 @@ class DataIngestionComponents:
                 embedding_model=self.config.embedding_model_name,
                 status="success"
             )
-            
+
         except Exception as e:
             logging.exception(e)
             raise CustomException(e, sys)
@@ -3,12 +3,17 @@
 
 import sys
 import json
-import re
-from typing import List, Tuple
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 import chromadb
 from chromadb.config import Settings
 import httpx
+import numpy as np
 from transformers import pipeline
 from sentence_transformers import SentenceTransformer
 
@@ -17,6 +22,128 @@ from src.fact_checker.exception import CustomException
 from src.fact_checker.entity import ClaimEntity, RetrievalEntity, FactCheckEntity
 from src.fact_checker.config import FactCheckingConfigInstance
 from src.fact_checker.constants import DATA_INGESTION_CONSTANTS
+from src.fact_checker.utils import load_pickle
+
+# optimum's ONNX Runtime export gives 2-4x faster BERT inference on CPU; the
+# stock PyTorch pipeline remains the fallback when optimum is not installed
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+except ImportError:
+    ORTModelForSequenceClassification = None
+
+
+# Shared HTTP client for Ollama - reused across requests so connection setup
+# isn't paid per generation. Plain HTTP/1.1: httpx only negotiates HTTP/2
+# over TLS/ALPN, which the local http:// endpoint never offers
+_OLLAMA_CLIENT = httpx.Client(timeout=httpx.Timeout(300.0))
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _find_first_json(text: str, opener: str):
+    """
+    Locate and decode the first valid JSON value starting with `opener`
+    ('[' or '{') in text.
+
+    Scans candidate openers with raw_decode, which is linear in the
+    response length - unlike a non-greedy DOTALL regex, which can
+    backtrack quadratically on long LLM outputs with many brackets.
+    """
+    start = text.find(opener)
+    while start != -1:
+        try:
+            value, _ = _JSON_DECODER.raw_decode(text, start)
+            return value
+        except json.JSONDecodeError:
+            start = text.find(opener, start + 1)
+    return None
+
+
+@lru_cache(maxsize=1)
+def _get_claim_detector(model_name: str):
+    """
+    Process-level singleton for the claim detection pipeline.
+
+    Prefers an ONNX Runtime export of the model (cached under artifacts/)
+    when optimum is installed; falls back to the stock PyTorch pipeline.
+    """
+    if ORTModelForSequenceClassification is not None:
+        try:
+            from transformers import AutoTokenizer
+
+            export_dir = DATA_INGESTION_CONSTANTS.ARTIFACTS_DIR / "claimbuster_onnx"
+            if export_dir.exists():
+                model = ORTModelForSequenceClassification.from_pretrained(export_dir)
+            else:
+                model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+                model.save_pretrained(export_dir)
+
+            logging.info("Claim detection model running on ONNX Runtime")
+            return pipeline(
+                "text-classification",
+                model=model,
+                tokenizer=AutoTokenizer.from_pretrained(model_name),
+                truncation=True,
+                max_length=512
+            )
+        except Exception as e:
+            logging.exception(e)
+            logging.warning("ONNX export failed, falling back to PyTorch pipeline")
+
+    return pipeline(
+        "text-classification",
+        model=model_name,
+        truncation=True,
+        max_length=512
+    )
+
+
+# Fast-detector probabilities inside this band are considered borderline and
+# re-scored by the transformer; outside it the linear model's call is final
+FAST_DETECTOR_LOW = 0.3
+FAST_DETECTOR_HIGH = 0.7
+
+# Reasoning prefix marking a verdict that came from the verification error
+# fallback rather than the model - callers use it to avoid treating (or
+# caching) such responses as real verdicts
+VERIFICATION_ERROR_PREFIX = "Error during verification:"
+
+
+@lru_cache(maxsize=1)
+def _get_fast_claim_detector(path: str):
+    """
+    Process-level singleton for the TF-IDF + logistic regression detector.
+
+    The model is trained offline on the ClaimBuster dataset and pickled to
+    artifacts/. Returns None when the pickle is absent or scikit-learn is
+    not installed, in which case callers use the transformer pipeline.
+    """
+    if not Path(path).exists():
+        return None
+    try:
+        detector = load_pickle(path)
+        logging.info(f"Loaded fast claim detector from {path}")
+        return detector
+    except Exception as e:
+        logging.exception(e)
+        logging.warning("Could not load fast claim detector, using transformer pipeline")
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_embedder(model_name: str) -> SentenceTransformer:
+    """Process-level singleton for the retrieval embedding model"""
+    return SentenceTransformer(model_name)
+
+
+@lru_cache(maxsize=1)
+def _get_chroma_collection(path: str, collection_name: str) -> chromadb.Collection:
+    """Process-level singleton for the ChromaDB collection handle"""
+    client = chromadb.PersistentClient(
+        path=path,
+        settings=Settings(anonymized_telemetry=False)
+    )
+    return client.get_collection(name=collection_name)
 
 
 class FactCheckingComponents:
@@ -34,23 +161,35 @@ class FactCheckingComponents:
         result = component.run("The claim to check...")
     """
     
-    def __init__(self, config=None):
-        """Initialize with configuration"""
+    def __init__(self, config=None, preload: bool = False):
+        """Initialize with configuration.
+
+        With preload=True the claim detector, embedding model and ChromaDB
+        connection are loaded immediately on parallel threads instead of
+        lazily on first use, so the first request doesn't pay the load cost.
+        """
         self.config = config or FactCheckingConfigInstance
         self.claim_detector = None
         self.embedding_model = None
         self.chroma_collection = None
-        
+        if preload:
+            # The three loads are independent and mostly I/O + deserialization,
+            # so overlapping them hides all but the slowest one
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(self._load_claim_detector),
+                    executor.submit(self._load_embedding_model),
+                    executor.submit(self._load_chromadb)
+                ]
+                for future in futures:
+                    future.result()
+
+
     def _load_claim_detector(self):
-        """Load claim detection model from HuggingFace"""
+        """Load claim detection model from HuggingFace (cached per process)"""
         try:
             logging.info(f"Loading claim detection model: {self.config.claim_detection_model}")
-            self.claim_detector = pipeline(
-                "text-classification",
-                model=self.config.claim_detection_model,
-                truncation=True,
-                max_length=512
-            )
+            self.claim_detector = _get_claim_detector(self.config.claim_detection_model)
             logging.info("Claim detection model loaded successfully")
             
         except Exception as e:
@@ -58,11 +197,11 @@ class FactCheckingComponents:
             raise CustomException(e, sys)
     
     def _load_embedding_model(self):
-        """Load embedding model for retrieval"""
+        """Load embedding model for retrieval (cached per process)"""
         try:
             model_name = DATA_INGESTION_CONSTANTS.EMBEDDING_MODEL_NAME
             logging.info(f"Loading embedding model: {model_name}")
-            self.embedding_model = SentenceTransformer(model_name)
+            self.embedding_model = _get_embedder(model_name)
             logging.info("Embedding model loaded successfully")
             
         except Exception as e:
@@ -70,69 +209,132 @@ class FactCheckingComponents:
             raise CustomException(e, sys)
     
     def _load_chromadb(self):
-        """Connect to ChromaDB collection"""
+        """Connect to ChromaDB collection (cached per process)"""
         try:
             chroma_path = DATA_INGESTION_CONSTANTS.CHROMA_DB_PATH
             collection_name = DATA_INGESTION_CONSTANTS.COLLECTION_NAME
             
             logging.info(f"Connecting to ChromaDB at {chroma_path}")
-            client = chromadb.PersistentClient(
-                path=str(chroma_path),
-                settings=Settings(anonymized_telemetry=False)
-            )
-            self.chroma_collection = client.get_collection(name=collection_name)
+            self.chroma_collection = _get_chroma_collection(str(chroma_path), collection_name)
             logging.info(f"Connected to collection '{collection_name}' with {self.chroma_collection.count()} documents")
             
         except Exception as e:
             logging.exception(e)
             raise CustomException(e, sys)
     
-    def _call_ollama(self, model: str, prompt: str) -> str:
-        """Call Ollama API for LLM inference"""
+    def _call_ollama(self, model: str, prompt: str, options: dict = None) -> str:
+        """Call Ollama API for LLM inference and return the full response"""
+        return "".join(self._call_ollama_stream(model, prompt, options))
+
+    def _call_ollama_stream(self, model: str, prompt: str, options: dict = None):
+        """Call Ollama API with streaming enabled, yielding response chunks"""
         try:
             url = f"{self.config.ollama_base_url}/api/generate"
             payload = {
                 "model": model,
                 "prompt": prompt,
-                "stream": False
+                "stream": True,
+                "keep_alive": -1
             }
-            
-            logging.info(f"Calling Ollama model: {model}")
-            
-            with httpx.Client(timeout=300.0) as client:
-                response = client.post(url, json=payload)
+            if options:
+                payload["options"] = options
+
+            logging.info(f"Calling Ollama model (streaming): {model}")
+
+            with _OLLAMA_CLIENT.stream("POST", url, json=payload) as response:
                 response.raise_for_status()
-                result = response.json()
-                return result.get("response", "")
-                
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    text = chunk.get("response", "")
+                    if text:
+                        yield text
+                    if chunk.get("done"):
+                        break
+
         except Exception as e:
             logging.exception(e)
             raise CustomException(e, sys)
-    
+
+    async def _call_ollama_async(self, client: httpx.AsyncClient, model: str, prompt: str, options: dict = None) -> str:
+        """Async variant of _call_ollama, for driving generations concurrently.
+
+        Takes the AsyncClient explicitly: each batch runs under its own
+        asyncio.run loop, and pooled connections from a module-level client
+        would outlive the loop they were opened on and fail on reuse.
+        """
+        try:
+            url = f"{self.config.ollama_base_url}/api/generate"
+            payload = {
+                "model": model,
+                "prompt": prompt,
+                "stream": False,
+                "keep_alive": -1
+            }
+            if options:
+                payload["options"] = options
+
+            logging.info(f"Calling Ollama model (async): {model}")
+
+            response = await client.post(url, json=payload)
+            response.raise_for_status()
+            return response.json().get("response", "")
+
+        except Exception as e:
+            logging.exception(e)
+            raise CustomException(e, sys)
+
+    def _detect_fast(self, text: str) -> Optional[Tuple[bool, float]]:
+        """Classify claim worthiness with the linear fast path.
+
+        Returns None when the fast detector is unavailable or its score is
+        borderline; callers then fall back to the transformer.
+        """
+        fast_detector = _get_fast_claim_detector(str(self.config.fast_claim_detector_path))
+        if fast_detector is None:
+            return None
+        probability = float(fast_detector.predict_proba([text])[0, 1])
+        if FAST_DETECTOR_LOW < probability < FAST_DETECTOR_HIGH:
+            logging.info(f"Fast detector borderline ({probability:.3f}), deferring to transformer")
+            return None
+        is_claim_worthy = probability >= 0.5
+        logging.info(f"Claim detection result (fast): score={probability:.3f}, is_claim_worthy={is_claim_worthy}")
+        return is_claim_worthy, probability
+
+    @staticmethod
+    def _detect_from_transformer(result: dict) -> Tuple[bool, float]:
+        """Apply the worthiness rule to one transformer classification result"""
+        # ClaimBuster model returns labels like 'NFS' (non-factual), 'UFS' (unimportant factual), 'CFS' (check-worthy factual)
+        label = result.get('label', '')
+        score = result.get('score', 0.0)
+
+        # CFS means check-worthy factual statement
+        is_claim_worthy = 'CFS' in label.upper() or score > 0.5
+
+        logging.info(f"Claim detection result: label={label}, score={score}, is_claim_worthy={is_claim_worthy}")
+        return is_claim_worthy, score
+
     def detect_claim(self, text: str) -> Tuple[bool, float]:
         """
         Detect if the input text contains a claim worth checking.
-        
+
         Returns:
             Tuple[bool, float]: (is_claim_worthy, confidence_score)
         """
         try:
+            # Sub-millisecond linear model first; the transformer only runs
+            # for borderline scores (or when the pickle isn't shipped)
+            fast = self._detect_fast(text)
+            if fast is not None:
+                return fast
+
             if self.claim_detector is None:
                 self._load_claim_detector()
-            
+
             logging.info("Detecting claim worthiness...")
-            result = self.claim_detector(text)[0]
-            
-            # ClaimBuster model returns labels like 'NFS' (non-factual), 'UFS' (unimportant factual), 'CFS' (check-worthy factual)
-            label = result.get('label', '')
-            score = result.get('score', 0.0)
-            
-            # CFS means check-worthy factual statement
-            is_claim_worthy = 'CFS' in label.upper() or score > 0.5
-            
-            logging.info(f"Claim detection result: label={label}, score={score}, is_claim_worthy={is_claim_worthy}")
-            return is_claim_worthy, score
-            
+            return self._detect_from_transformer(self.claim_detector(text)[0])
+
         except Exception as e:
             logging.exception(e)
             # Default to True to allow processing even if detection fails
@@ -151,24 +353,46 @@ class FactCheckingComponents:
             prompt = self.config.extraction_prompt.format(input_text=text)
             response = self._call_ollama(self.config.extraction_model, prompt)
             
-            # Parse JSON array from response
-            # Try to find JSON array in the response
-            match = re.search(r'\[.*?\]', response, re.DOTALL)
-            if match:
-                claims = json.loads(match.group())
-                logging.info(f"Extracted {len(claims)} claims")
-                return claims
-            else:
-                # If no JSON found, use the original text as the claim
-                logging.warning("Could not parse claims from LLM response, using original text")
-                return [text]
+            return self._parse_claims(response, text)
                 
-        except json.JSONDecodeError:
-            logging.warning("Failed to parse JSON from LLM response, using original text")
+        except Exception as e:
+            logging.exception(e)
             return [text]
+
+    async def extract_claims_async(self, client: httpx.AsyncClient, text: str) -> List[str]:
+        """Async variant of extract_claims, for concurrent batch extraction"""
+        try:
+            logging.info("Extracting claims from input text (async)...")
+
+            prompt = self.config.extraction_prompt.format(input_text=text)
+            response = await self._call_ollama_async(client, self.config.extraction_model, prompt)
+
+            return self._parse_claims(response, text)
+
         except Exception as e:
             logging.exception(e)
             return [text]
+
+    def _needs_extraction(self, text: str) -> bool:
+        """
+        Whether the input needs the LLM extraction step.
+
+        Short single-sentence inputs already are the claim, so the
+        seconds-long extraction round-trip is skipped for them.
+        """
+        return len(text) >= self.config.extraction_skip_maxlen or text.count('.') > 1
+
+    def _parse_claims(self, response: str, text: str) -> List[str]:
+        """Parse the extracted claims array from the LLM response"""
+        # Parse the first valid JSON array from the response
+        claims = _find_first_json(response, '[')
+        if isinstance(claims, list) and claims:
+            logging.info(f"Extracted {len(claims)} claims")
+            return claims
+        else:
+            # If no JSON found, use the original text as the claim
+            logging.warning("Could not parse claims from LLM response, using original text")
+            return [text]
     
     def retrieve_facts(self, claim: str) -> RetrievalEntity:
         """
@@ -185,12 +409,13 @@ class FactCheckingComponents:
             
             logging.info(f"Retrieving top-{self.config.top_k_results} facts for claim...")
             
-            # Generate embedding for the claim
-            query_embedding = self.embedding_model.encode([claim])[0]
-            
-            # Query ChromaDB
+            # Generate embedding for the claim - normalized to match the
+            # collection's cosine space
+            query_embedding = self.embedding_model.encode([claim], normalize_embeddings=True)[0]
+
+            # Query ChromaDB - the ndarray is accepted as-is
             results = self.chroma_collection.query(
-                query_embeddings=[query_embedding.tolist()],
+                query_embeddings=[query_embedding],
                 n_results=self.config.top_k_results,
                 include=["documents", "metadatas", "distances"]
             )
@@ -199,9 +424,8 @@ class FactCheckingComponents:
             distances = results.get('distances', [[]])[0]
             metadatas = results.get('metadatas', [[]])[0]
             
-            # Convert distances to similarity scores (ChromaDB returns L2 distances)
-            # Lower distance = higher similarity
-            similarity_scores = [1 / (1 + d) for d in distances]
+            # Cosine distance from unit vectors: similarity is just 1 - d
+            similarity_scores = (1.0 - np.asarray(distances, dtype=np.float32)).tolist()
             sources = [m.get('source', 'Unknown') for m in metadatas]
             
             logging.info(f"Retrieved {len(documents)} relevant facts")
@@ -217,6 +441,60 @@ class FactCheckingComponents:
             logging.exception(e)
             raise CustomException(e, sys)
     
+    def retrieve_facts_batch(self, claims: List[str]) -> List[RetrievalEntity]:
+        """
+        Retrieve relevant facts for several claims in one ChromaDB query.
+
+        Embeds all claims in a single encode call and issues one batched
+        query, so the per-claim cost is just the HNSW traversal.
+
+        Returns:
+            List[RetrievalEntity]: One retrieval result per claim
+        """
+        try:
+            if self.embedding_model is None:
+                self._load_embedding_model()
+            if self.chroma_collection is None:
+                self._load_chromadb()
+
+            logging.info(f"Retrieving top-{self.config.top_k_results} facts for {len(claims)} claims...")
+
+            query_embeddings = self.embedding_model.encode(
+                claims,
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
+
+            results = self.chroma_collection.query(
+                query_embeddings=query_embeddings,
+                n_results=self.config.top_k_results,
+                include=["documents", "metadatas", "distances"]
+            )
+
+            entities = []
+            for pos, claim in enumerate(claims):
+                documents = results.get('documents', [[]])[pos]
+                distances = results.get('distances', [[]])[pos]
+                metadatas = results.get('metadatas', [[]])[pos]
+
+                similarity_scores = (1.0 - np.asarray(distances, dtype=np.float32)).tolist()
+                sources = [m.get('source', 'Unknown') for m in metadatas]
+
+                entities.append(RetrievalEntity(
+                    query=claim,
+                    retrieved_documents=documents,
+                    similarity_scores=similarity_scores,
+                    sources=sources
+                ))
+
+            logging.info(f"Retrieved facts for {len(entities)} claims")
+            return entities
+
+        except Exception as e:
+            logging.exception(e)
+            raise CustomException(e, sys)
+
     def verify_claim(self, claim: str, evidence: List[str]) -> Tuple[str, str]:
         """
         Verify claim against retrieved evidence using LLM.
@@ -236,32 +514,65 @@ class FactCheckingComponents:
             )
             
             response = self._call_ollama(self.config.verification_model, prompt)
-            
-            # Parse JSON response
-            # Try to find JSON object in response
-            match = re.search(r'\{.*?\}', response, re.DOTALL)
-            if match:
-                try:
-                    result = json.loads(match.group())
-                    verdict = result.get('verdict', 'Unverifiable')
-                    reasoning = result.get('reasoning', 'Unable to determine.')
-                    logging.info(f"Verification result: {verdict}")
-                    return verdict, reasoning
-                except json.JSONDecodeError:
-                    pass
-            
-            # Fallback: try to extract verdict from text
-            response_lower = response.lower()
-            if 'true' in response_lower and 'false' not in response_lower:
-                return 'True', response
-            elif 'false' in response_lower:
-                return 'False', response
-            else:
-                return 'Unverifiable', response
-                
+
+            return self._parse_verdict(response)
+
+        except Exception as e:
+            logging.exception(e)
+            return 'Unverifiable', f"{VERIFICATION_ERROR_PREFIX} {str(e)}"
+
+    async def verify_claim_async(self, client: httpx.AsyncClient, claim: str, evidence: List[str]) -> Tuple[str, str]:
+        """Async variant of verify_claim, for concurrent batch verification"""
+        try:
+            logging.info("Verifying claim against evidence (async)...")
+
+            evidence_text = "\n".join([f"- {e}" for e in evidence])
+
+            prompt = self.config.verification_prompt.format(
+                claim=claim,
+                evidence=evidence_text
+            )
+
+            response = await self._call_ollama_async(client, self.config.verification_model, prompt)
+
+            return self._parse_verdict(response)
+
         except Exception as e:
             logging.exception(e)
-            return 'Unverifiable', f"Error during verification: {str(e)}"
+            return 'Unverifiable', f"{VERIFICATION_ERROR_PREFIX} {str(e)}"
+
+    async def _extract_claims_many(self, texts: List[str]) -> List[List[str]]:
+        """Run claim extraction for several inputs concurrently.
+
+        The AsyncClient is scoped to this coroutine so its connections live
+        and die with the event loop asyncio.run creates for it.
+        """
+        async with httpx.AsyncClient(timeout=httpx.Timeout(300.0)) as client:
+            return await asyncio.gather(*[self.extract_claims_async(client, text) for text in texts])
+
+    async def _verify_claims_many(self, pairs: List[Tuple[str, List[str]]]) -> List[Tuple[str, str]]:
+        """Run claim verification for several (claim, evidence) pairs concurrently"""
+        async with httpx.AsyncClient(timeout=httpx.Timeout(300.0)) as client:
+            return await asyncio.gather(*[self.verify_claim_async(client, claim, evidence) for claim, evidence in pairs])
+
+    def _parse_verdict(self, response: str) -> Tuple[str, str]:
+        """Parse (verdict, reasoning) from the verification model's response"""
+        # Parse the first valid JSON object from the response
+        result = _find_first_json(response, '{')
+        if isinstance(result, dict):
+            verdict = result.get('verdict', 'Unverifiable')
+            reasoning = result.get('reasoning', 'Unable to determine.')
+            logging.info(f"Verification result: {verdict}")
+            return verdict, reasoning
+
+        # Fallback: try to extract verdict from text
+        response_lower = response.lower()
+        if 'true' in response_lower and 'false' not in response_lower:
+            return 'True', response
+        elif 'false' in response_lower:
+            return 'False', response
+        else:
+            return 'Unverifiable', response
     
     def run(self, input_text: str) -> FactCheckEntity:
         """
@@ -293,9 +604,13 @@ class FactCheckingComponents:
                     confidence_score=claim_score
                 )
             
-            # Step 2: Extract key claims
-            claims = self.extract_claims(input_text)
-            main_claim = claims[0] if claims else input_text
+            # Step 2: Extract key claims (skipped when the short input
+            # already is the claim)
+            if self._needs_extraction(input_text):
+                claims = self.extract_claims(input_text)
+                main_claim = claims[0] if claims else input_text
+            else:
+                main_claim = input_text
             
             # Step 3: Retrieve relevant facts
             retrieval_result = self.retrieve_facts(main_claim)
@@ -322,5 +637,284 @@ class FactCheckingComponents:
             logging.exception(e)
             raise CustomException(e, sys)
 
+    def encode_claim(self, text: str):
+        """
+        Encode a claim with the retrieval embedding model.
+
+        Returns a unit-normalized vector so callers can compare claims
+        with a plain dot product (cosine similarity).
+        """
+        try:
+            if self.embedding_model is None:
+                self._load_embedding_model()
+
+            return self.embedding_model.encode([text], normalize_embeddings=True)[0]
+
+        except Exception as e:
+            logging.exception(e)
+            raise CustomException(e, sys)
+
+    def preload_models(self) -> None:
+        """
+        Force-load the Ollama models into memory so the first request
+        doesn't pay the cold-load cost (tens of seconds for 7B on CPU).
+
+        Sends an empty generation with keep_alive=-1 and num_predict=0 per
+        model, which makes Ollama load and pin the weights without
+        generating anything.
+        """
+        try:
+            url = f"{self.config.ollama_base_url}/api/generate"
+
+            for model in (self.config.extraction_model, self.config.verification_model):
+                logging.info(f"Preloading Ollama model: {model}")
+                response = _OLLAMA_CLIENT.post(url, json={
+                    "model": model,
+                    "prompt": "",
+                    "keep_alive": -1,
+                    "options": {"num_predict": 0}
+                })
+                response.raise_for_status()
+                logging.info(f"Ollama model resident: {model}")
+
+        except Exception as e:
+            logging.exception(e)
+            raise CustomException(e, sys)
+
+    def smoke_test(self) -> bool:
+        """
+        Lightweight readiness probe.
+
+        Runs one vector-DB similarity query and a single-token LLM
+        generation instead of a full pipeline pass, so startup keeps its
+        readiness guarantee without a multi-stage generation.
+
+        Returns:
+            bool: True if retrieval and the LLM both respond
+        """
+        try:
+            if self.embedding_model is None:
+                self._load_embedding_model()
+            if self.chroma_collection is None:
+                self._load_chromadb()
+
+            logging.info("Running smoke test (retrieval + 1-token generation)...")
+
+            query_embedding = self.embedding_model.encode(["health"])[0]
+            self.chroma_collection.query(
+                query_embeddings=[query_embedding],
+                n_results=1
+            )
+
+            self._call_ollama(
+                self.config.verification_model,
+                "ok",
+                options={"num_predict": 1, "num_ctx": 64}
+            )
+
+            logging.info("Smoke test passed")
+            return True
+
+        except Exception as e:
+            logging.exception(e)
+            raise CustomException(e, sys)
+
+    def run_stream(self, input_text: str):
+        """
+        Execute the fact-checking pipeline, yielding intermediate events.
+
+        Yields dicts with 'event' and 'data' keys:
+            detection -> claim-worthiness result
+            claim     -> extracted main claim
+            evidence  -> retrieved evidence and sources
+            token     -> chunk of raw verification model output
+            result    -> final FactCheckEntity fields
+
+        Args:
+            input_text: The claim or statement to fact-check
+        """
+        try:
+            logging.info("=" * 50)
+            logging.info("Starting Fact Checking Pipeline (streaming)")
+            logging.info(f"Input: {input_text[:100]}...")
+            logging.info("=" * 50)
+
+            # Step 1: Detect if input is a claim
+            is_claim_worthy, claim_score = self.detect_claim(input_text)
+            yield {
+                "event": "detection",
+                "data": {"is_claim_worthy": is_claim_worthy, "score": claim_score}
+            }
+
+            if not is_claim_worthy:
+                result = FactCheckEntity(
+                    original_input=input_text,
+                    claim=input_text,
+                    verdict="Unverifiable",
+                    evidence=[],
+                    reasoning="The input does not appear to contain a factual claim that can be verified.",
+                    confidence_score=claim_score
+                )
+                yield {"event": "result", "data": asdict(result)}
+                return
+
+            # Step 2: Extract key claims (skipped when the short input
+            # already is the claim)
+            if self._needs_extraction(input_text):
+                claims = self.extract_claims(input_text)
+                main_claim = claims[0] if claims else input_text
+            else:
+                main_claim = input_text
+            yield {"event": "claim", "data": {"claim": main_claim}}
+
+            # Step 3: Retrieve relevant facts
+            retrieval_result = self.retrieve_facts(main_claim)
+            yield {
+                "event": "evidence",
+                "data": {
+                    "evidence": retrieval_result.retrieved_documents,
+                    "sources": retrieval_result.sources
+                }
+            }
+
+            # Step 4: Verify claim, streaming model output as it generates
+            evidence_text = "\n".join([f"- {e}" for e in retrieval_result.retrieved_documents])
+            prompt = self.config.verification_prompt.format(
+                claim=main_claim,
+                evidence=evidence_text
+            )
+
+            chunks = []
+            for chunk in self._call_ollama_stream(self.config.verification_model, prompt):
+                chunks.append(chunk)
+                yield {"event": "token", "data": {"text": chunk}}
+
+            verdict, reasoning = self._parse_verdict("".join(chunks))
+
+            logging.info("Fact Checking Pipeline (streaming) completed successfully")
+            logging.info("=" * 50)
+
+            result = FactCheckEntity(
+                original_input=input_text,
+                claim=main_claim,
+                verdict=verdict,
+                evidence=retrieval_result.retrieved_documents,
+                reasoning=reasoning,
+                confidence_score=max(retrieval_result.similarity_scores) if retrieval_result.similarity_scores else 0.0
+            )
+            yield {"event": "result", "data": asdict(result)}
+
+        except Exception as e:
+            logging.exception(e)
+            raise CustomException(e, sys)
+
+    def run_batch(self, input_texts: List[str]) -> List[FactCheckEntity]:
+        """
+        Fact-check several inputs in one pass.
+
+        Claim detection runs as a single classifier batch and retrieval
+        embeddings are encoded together, so concurrent requests amortize
+        model overhead. LLM extraction and verification remain per-claim.
+
+        Args:
+            input_texts: The claims/statements to fact-check
+
+        Returns:
+            List[FactCheckEntity]: One result per input, in input order
+        """
+        try:
+            if len(input_texts) == 1:
+                return [self.run(input_texts[0])]
+
+            logging.info("=" * 50)
+            logging.info(f"Starting Fact Checking Pipeline (batch of {len(input_texts)})")
+            logging.info("=" * 50)
+
+            # Step 1: Detect claims - same policy as the single-claim path:
+            # linear fast path per text, then one transformer forward pass
+            # batched over whatever it couldn't settle
+            detections: List[Optional[Tuple[bool, float]]] = [None] * len(input_texts)
+            deferred = []
+            for i, text in enumerate(input_texts):
+                try:
+                    detections[i] = self._detect_fast(text)
+                except Exception as e:
+                    logging.exception(e)
+                if detections[i] is None:
+                    deferred.append(i)
+
+            if deferred:
+                if self.claim_detector is None:
+                    self._load_claim_detector()
+                try:
+                    transformer_results = self.claim_detector([input_texts[i] for i in deferred])
+                    for i, result in zip(deferred, transformer_results):
+                        detections[i] = self._detect_from_transformer(result)
+                except Exception as e:
+                    logging.exception(e)
+                    # Default to claim-worthy so inputs are still processed
+                    for i in deferred:
+                        detections[i] = (True, 0.5)
+
+            results: List[Optional[FactCheckEntity]] = [None] * len(input_texts)
+            pending = []
+            for i, (is_claim_worthy, score) in enumerate(detections):
+                if is_claim_worthy:
+                    pending.append(i)
+                else:
+                    results[i] = FactCheckEntity(
+                        original_input=input_texts[i],
+                        claim=input_texts[i],
+                        verdict="Unverifiable",
+                        evidence=[],
+                        reasoning="The input does not appear to contain a factual claim that can be verified.",
+                        confidence_score=score
+                    )
+
+            # Step 2: Extract key claims - short single-sentence inputs skip
+            # extraction entirely; the rest run their LLM round-trips
+            # concurrently instead of back-to-back
+            main_claims = {i: input_texts[i] for i in pending}
+            needs_extraction = [i for i in pending if self._needs_extraction(input_texts[i])]
+            if needs_extraction:
+                extractions = asyncio.run(
+                    self._extract_claims_many([input_texts[i] for i in needs_extraction])
+                )
+                for i, claims in zip(needs_extraction, extractions):
+                    main_claims[i] = claims[0] if claims else input_texts[i]
+
+            if pending:
+                # Step 3: Batched retrieval - one encode call + one ChromaDB query
+                retrievals = self.retrieve_facts_batch([main_claims[i] for i in pending])
+
+                # Step 4: Verify all claims concurrently - Ollama overlaps the
+                # in-flight generations as far as its parallelism allows
+                verdicts = asyncio.run(self._verify_claims_many([
+                    (main_claims[i], retrieval.retrieved_documents)
+                    for i, retrieval in zip(pending, retrievals)
+                ]))
+
+                for pos, i in enumerate(pending):
+                    retrieval = retrievals[pos]
+                    verdict, reasoning = verdicts[pos]
+
+                    results[i] = FactCheckEntity(
+                        original_input=input_texts[i],
+                        claim=main_claims[i],
+                        verdict=verdict,
+                        evidence=retrieval.retrieved_documents,
+                        reasoning=reasoning,
+                        confidence_score=max(retrieval.similarity_scores) if retrieval.similarity_scores else 0.0
+                    )
+
+            logging.info("Fact Checking Pipeline batch completed successfully")
+            logging.info("=" * 50)
+
+            return results
+
+        except Exception as e:
+            logging.exception(e)
+            raise CustomException(e, sys)
+
 
-__all__ = ["FactCheckingComponents"]
+__all__ = ["FactCheckingComponents", "VERIFICATION_ERROR_PREFIX"]
@@ -7,64 +7,47 @@ from pathlib import Path
 
 class DataIngestionConfig:
     """Configuration for Data Ingestion Pipeline"""
-    
+
+    __slots__ = (
+        "artifacts_dir", "csv_file_path", "chroma_db_path", "collection_name",
+        "embedding_model_name", "encode_batch_size", "add_batch_size",
+        "add_max_workers"
+    )
+
     def __init__(self):
-        self.constants = DATA_INGESTION_CONSTANTS
-        
-    @property
-    def artifacts_dir(self) -> Path:
-        return self.constants.ARTIFACTS_DIR
-    
-    @property
-    def csv_file_path(self) -> Path:
-        return self.constants.CSV_FILE_PATH
-    
-    @property
-    def chroma_db_path(self) -> Path:
-        return self.constants.CHROMA_DB_PATH
-    
-    @property
-    def collection_name(self) -> str:
-        return self.constants.COLLECTION_NAME
-    
-    @property
-    def embedding_model_name(self) -> str:
-        return self.constants.EMBEDDING_MODEL_NAME
+        # Values never change after construction, so copy them into plain
+        # attributes once instead of routing every read through a property
+        c = DATA_INGESTION_CONSTANTS
+        self.artifacts_dir: Path = c.ARTIFACTS_DIR
+        self.csv_file_path: Path = c.CSV_FILE_PATH
+        self.chroma_db_path: Path = c.CHROMA_DB_PATH
+        self.collection_name: str = c.COLLECTION_NAME
+        self.embedding_model_name: str = c.EMBEDDING_MODEL_NAME
+        self.encode_batch_size: int = c.ENCODE_BATCH_SIZE
+        self.add_batch_size: int = c.ADD_BATCH_SIZE
+        self.add_max_workers: int = c.ADD_MAX_WORKERS
 
 
 class FactCheckingConfig:
     """Configuration for Fact Checking Pipeline"""
-    
+
+    __slots__ = (
+        "ollama_base_url", "extraction_model", "verification_model",
+        "claim_detection_model", "fast_claim_detector_path", "top_k_results",
+        "extraction_skip_maxlen", "extraction_prompt", "verification_prompt"
+    )
+
     def __init__(self):
-        self.constants = FACT_CHECKING_CONSTANTS
-        
-    @property
-    def ollama_base_url(self) -> str:
-        return self.constants.OLLAMA_BASE_URL
-    
-    @property
-    def extraction_model(self) -> str:
-        return self.constants.EXTRACTION_MODEL
-    
-    @property
-    def verification_model(self) -> str:
-        return self.constants.VERIFICATION_MODEL
-    
-    @property
-    def claim_detection_model(self) -> str:
-        return self.constants.CLAIM_DETECTION_MODEL
-    
-    @property
-    def top_k_results(self) -> int:
-        return self.constants.TOP_K_RESULTS
-    
-    @property
-    def extraction_prompt(self) -> str:
-        return self.constants.EXTRACTION_PROMPT
-    
-    @property
-    def verification_prompt(self) -> str:
-        return self.constants.VERIFICATION_PROMPT
+        c = FACT_CHECKING_CONSTANTS
+        self.ollama_base_url: str = c.OLLAMA_BASE_URL
+        self.extraction_model: str = c.EXTRACTION_MODEL
+        self.verification_model: str = c.VERIFICATION_MODEL
+        self.claim_detection_model: str = c.CLAIM_DETECTION_MODEL
+        self.fast_claim_detector_path: Path = c.FAST_CLAIM_DETECTOR_PATH
+        self.top_k_results: int = c.TOP_K_RESULTS
+        self.extraction_skip_maxlen: int = c.EXTRACTION_SKIP_MAXLEN
+        self.extraction_prompt: str = c.EXTRACTION_PROMPT
+        self.verification_prompt: str = c.VERIFICATION_PROMPT
 
 
 # Create config instances
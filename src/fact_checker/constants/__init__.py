@@ -1,52 +1,65 @@
 # Constants for LLM-Powered Fact Checker
 # Each pipeline has its own constants class
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 from pathlib import Path
 
 
-class DataIngestionConstants(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DataIngestionConstants:
     """Constants for Data Ingestion Pipeline"""
-    
+
     # Paths
-    ARTIFACTS_DIR: Path = Field(default=Path("artifacts"))
-    CSV_FILE_PATH: Path = Field(default=Path("artifacts/verified_facts.csv"))
-    CHROMA_DB_PATH: Path = Field(default=Path("artifacts/chroma_db"))
-    
+    ARTIFACTS_DIR: Path = Path("artifacts")
+    CSV_FILE_PATH: Path = Path("artifacts/verified_facts.csv")
+    CHROMA_DB_PATH: Path = Path("artifacts/chroma_db")
+
     # ChromaDB
-    COLLECTION_NAME: str = Field(default="verified_facts")
-    
+    COLLECTION_NAME: str = "verified_facts"
+    ADD_BATCH_SIZE: int = 1024
+    ADD_MAX_WORKERS: int = 4
+
     # Embedding Model (HuggingFace)
-    EMBEDDING_MODEL_NAME: str = Field(default="Qwen/Qwen3-Embedding-0.6B")
-    
+    EMBEDDING_MODEL_NAME: str = "Qwen/Qwen3-Embedding-0.6B"
+    ENCODE_BATCH_SIZE: int = 256
 
-class FactCheckingConstants(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class FactCheckingConstants:
     """Constants for Fact Checking Pipeline"""
-    
+
     # Ollama Configuration
-    OLLAMA_BASE_URL: str = Field(default="http://localhost:11434")
-    
+    OLLAMA_BASE_URL: str = "http://localhost:11434"
+
     # LLM Models (Ollama)
-    EXTRACTION_MODEL: str = Field(default="gemma:7b")
-    VERIFICATION_MODEL: str = Field(default="deepseek-r1:7b")
-    
+    EXTRACTION_MODEL: str = "gemma:7b"
+    VERIFICATION_MODEL: str = "deepseek-r1:7b"
+
     # Claim Detection Model (HuggingFace)
-    CLAIM_DETECTION_MODEL: str = Field(default="Nithiwat/bert-base_claimbuster")
-    
+    CLAIM_DETECTION_MODEL: str = "Nithiwat/bert-base_claimbuster"
+
+    # Optional TF-IDF + logistic regression detector trained offline on the
+    # ClaimBuster dataset; used ahead of the transformer when present
+    FAST_CLAIM_DETECTOR_PATH: Path = Path("artifacts/claim_detector_fast.pkl")
+
     # Retrieval
-    TOP_K_RESULTS: int = Field(default=3)
-    
+    TOP_K_RESULTS: int = 3
+
+    # Inputs shorter than this with at most one sentence are used as the
+    # claim directly, skipping the extraction LLM round-trip
+    EXTRACTION_SKIP_MAXLEN: int = 200
+
     # Prompts
-    EXTRACTION_PROMPT: str = Field(default="""
+    EXTRACTION_PROMPT: str = """
 You are a claim extraction assistant. Extract the main factual claims from the following text.
 Return ONLY the key claims as a JSON array of strings.
 
 Text: {input_text}
 
 Output format: ["claim1", "claim2", ...]
-""")
-    
-    VERIFICATION_PROMPT: str = Field(default="""
+"""
+
+    VERIFICATION_PROMPT: str = """
 You are a fact-checking assistant. Compare the claim against the retrieved evidence and determine if the claim is True, False, or Unverifiable.
 
 Claim: {claim}
@@ -59,7 +72,7 @@ Analyze the claim against the evidence and respond in the following JSON format:
     "verdict": "True" | "False" | "Unverifiable",
     "reasoning": "Your detailed explanation of why this verdict was chosen"
 }}
-""")
+"""
 
 
 # Instantiate constants
@@ -68,7 +81,7 @@ FACT_CHECKING_CONSTANTS = FactCheckingConstants()
 
 __all__ = [
     "DataIngestionConstants",
-    "FactCheckingConstants", 
+    "FactCheckingConstants",
     "DATA_INGESTION_CONSTANTS",
     "FACT_CHECKING_CONSTANTS"
 ]
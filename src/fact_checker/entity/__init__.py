@@ -1,42 +1,47 @@
 # Entity classes - Return types for each pipeline
-# These are Pydantic models that define the output structure of components
+# Frozen slotted dataclasses: attribute access on the hot path skips the
+# descriptor/validation machinery a full Pydantic model would run
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 from typing import List, Optional
 from pathlib import Path
 
 
-class DataIngestionEntity(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DataIngestionEntity:
     """Return type for Data Ingestion Component"""
-    
+
     chroma_db_path: Path
     collection_name: str
     document_count: int
     embedding_model: str
-    status: str = Field(default="success")
+    status: str = "success"
 
 
-class ClaimEntity(BaseModel):
+@dataclass(frozen=True, slots=True)
+class ClaimEntity:
     """Entity for extracted claims"""
-    
+
     original_text: str
     extracted_claims: List[str]
     is_claim_worthy: bool
-    claim_score: float = Field(default=0.0)
+    claim_score: float = 0.0
 
 
-class RetrievalEntity(BaseModel):
+@dataclass(frozen=True, slots=True)
+class RetrievalEntity:
     """Entity for retrieved facts from vector database"""
-    
+
     query: str
     retrieved_documents: List[str]
     similarity_scores: List[float]
     sources: List[str]
 
 
-class FactCheckEntity(BaseModel):
+@dataclass(frozen=True, slots=True)
+class FactCheckEntity:
     """Return type for Fact Checking Pipeline - Final Output"""
-    
+
     original_input: str
     claim: str
     verdict: str  # "True", "False", or "Unverifiable"
@@ -47,7 +52,7 @@ class FactCheckEntity(BaseModel):
 
 __all__ = [
     "DataIngestionEntity",
-    "ClaimEntity", 
+    "ClaimEntity",
     "RetrievalEntity",
     "FactCheckEntity"
 ]
@@ -27,7 +27,9 @@ class FactCheckingPipeline:
     def component(self) -> FactCheckingComponents:
         """Lazy initialization of component for model loading"""
         if self._component is None:
-            self._component = FactCheckingComponents(self.config)
+            # preload so the models come up in parallel here instead of
+            # serially inside the first user request
+            self._component = FactCheckingComponents(self.config, preload=True)
         return self._component
         
     def run(self, claim: str) -> FactCheckEntity:
@@ -44,10 +46,64 @@ class FactCheckingPipeline:
         logging.info(f"Claim: {claim[:100]}...")
         
         result = self.component.run(claim)
-        
+
         logging.info(f"Fact Checking Pipeline completed: verdict={result.verdict}")
-        
+
         return result
 
+    def encode_claim(self, text: str):
+        """Encode a claim as a unit-normalized embedding vector"""
+        return self.component.encode_claim(text)
+
+    def preload_models(self) -> None:
+        """Force-load the Ollama models so the first request skips cold-load"""
+        logging.info("Preloading Ollama models")
+
+        self.component.preload_models()
+
+    def smoke_test(self) -> bool:
+        """
+        Run a lightweight readiness probe (one retrieval + 1-token generation).
+
+        Returns:
+            bool: True if the vector DB and LLM both respond
+        """
+        logging.info("Running Fact Checking Pipeline smoke test")
+
+        return self.component.smoke_test()
+
+    def run_stream(self, claim: str):
+        """
+        Execute the fact-checking pipeline, yielding intermediate events.
+
+        Args:
+            claim: The statement/claim to fact-check
+
+        Yields:
+            dict: Stage events (detection, claim, evidence, token, result)
+        """
+        logging.info("Initializing Fact Checking Pipeline (streaming)")
+        logging.info(f"Claim: {claim[:100]}...")
+
+        yield from self.component.run_stream(claim)
+
+    def run_batch(self, claims: list[str]) -> list[FactCheckEntity]:
+        """
+        Execute the fact-checking pipeline on a batch of claims.
+
+        Args:
+            claims: The statements/claims to fact-check
+
+        Returns:
+            list[FactCheckEntity]: One result per claim, in input order
+        """
+        logging.info(f"Initializing Fact Checking Pipeline for batch of {len(claims)} claims")
+
+        results = self.component.run_batch(claims)
+
+        logging.info(f"Fact Checking Pipeline batch completed: {len(results)} verdicts")
+
+        return results
+
 
 __all__ = ["FactCheckingPipeline"]